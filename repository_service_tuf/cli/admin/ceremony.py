@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: MIT
 
 import json
-from dataclasses import asdict
 from typing import Any, Optional
 
 import click
@@ -132,14 +131,14 @@ def ceremony(context: Any, out: Optional[click.File], dry_run: bool) -> None:
     bootstrap_payload = CeremonyPayload(roles_settings, metadatas)
     # Dump payload when the user explicitly wants or doesn't send it to the API
     if out:
-        json.dump(asdict(bootstrap_payload), out, indent=2)  # type: ignore
+        json.dump(bootstrap_payload.to_dict(), out, indent=2)  # type: ignore
         console.print(f"Saved result to '{out.name}'")
 
     if settings.get("SERVER") and not dry_run:
         task_id = send_payload(
             settings=settings,
             url=URL.BOOTSTRAP.value,
-            payload=asdict(bootstrap_payload),
+            payload=bootstrap_payload.to_dict(),
             expected_msg="Bootstrap accepted.",
             command_name="Bootstrap",
         )
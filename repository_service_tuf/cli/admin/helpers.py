@@ -66,15 +66,27 @@ class _OnlineSettings:
     bins_number: int
 
 
+# NOTE: The payload dataclasses below implement 'to_dict' explicitly instead
+# of relying on 'dataclasses.asdict', which recursively deep-copies every field
+# (including the whole root metadata dict) only to serialize it right away.
 @dataclass
 class Role:
     expiration: int
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"expiration": self.expiration}
+
 
 @dataclass
 class BinsRole(Role):
     number_of_delegated_bins: int
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "expiration": self.expiration,
+            "number_of_delegated_bins": self.number_of_delegated_bins,
+        }
+
 
 @dataclass
 class Roles:
@@ -84,33 +96,60 @@ class Roles:
     targets: Role
     bins: BinsRole
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "root": self.root.to_dict(),
+            "timestamp": self.timestamp.to_dict(),
+            "snapshot": self.snapshot.to_dict(),
+            "targets": self.targets.to_dict(),
+            "bins": self.bins.to_dict(),
+        }
+
 
 @dataclass
 class Settings:
     roles: Roles
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"roles": self.roles.to_dict()}
+
 
 @dataclass
 class Metadatas:  # accept bad spelling to disambiguate with Metadata
     root: dict[str, Any]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"root": self.root}
+
 
 @dataclass
 class CeremonyPayload:
     settings: "Settings"
     metadata: "Metadatas"
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "settings": self.settings.to_dict(),
+            "metadata": self.metadata.to_dict(),
+        }
+
 
 @dataclass
 class UpdatePayload:
     metadata: "Metadatas"
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"metadata": self.metadata.to_dict()}
+
 
 @dataclass
 class SignPayload:
     signature: dict[str, str]
     role: str = "root"
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"signature": self.signature, "role": self.role}
+
 
 ##############################################################################
 # Prompt and dialog helpers
@@ -184,16 +223,17 @@ def _load_key_prompt(root: Root) -> Optional[Key]:
 
 def _key_name_prompt(root) -> str:
     """Prompt for key name until success."""
+    # Collect names once, instead of scanning all keys on every retry.
+    used_names = {
+        k.unrecognized_fields.get(KEY_NAME_FIELD) for k in root.keys.values()
+    }
     while True:
         name = Prompt.ask("Please enter key name")
         if not name:
             console.print("Key name cannot be empty.")
             continue
 
-        if name in [
-            k.unrecognized_fields.get(KEY_NAME_FIELD)
-            for k in root.keys.values()
-        ]:
+        if name in used_names:
             console.print("\nKey name already in use.", style="bold red")
             continue
 
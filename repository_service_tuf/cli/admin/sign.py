@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: MIT
 
 import json
-from dataclasses import asdict
 from typing import Any, Dict, Optional
 
 import click
@@ -179,9 +178,9 @@ def sign(
     ###########################################################################
     # Send payload to the API and/or save it locally
 
-    payload = SignPayload(signature=signature.to_dict())
+    payload = SignPayload(signature=signature.to_dict()).to_dict()
     if out:
-        json.dump(asdict(payload), out, indent=2)  # type: ignore
+        json.dump(payload, out, indent=2)  # type: ignore
         console.print(f"Saved result to '{out.name}'")
 
     if settings.get("SERVER") and not dry_run:
@@ -189,7 +188,7 @@ def sign(
         task_id = send_payload(
             settings,
             URL.METADATA_SIGN.value,
-            asdict(payload),
+            payload,
             "Metadata sign accepted.",
             "Metadata sign",
         )
@@ -4,7 +4,6 @@
 
 import json
 from copy import deepcopy
-from dataclasses import asdict
 
 import click
 from rich.markdown import Markdown
@@ -111,5 +110,5 @@ def update(root_in, save) -> None:
     # TODO: post to API
     payload = UpdatePayload(Metadatas(root_md.to_dict()))
     if save:
-        json.dump(asdict(payload), save, indent=2)
+        json.dump(payload.to_dict(), save, indent=2)
         console.print(f"Saved result to '{save.name}'")
@@ -7,6 +7,7 @@
 # Ceremony
 #
 import os
+from functools import lru_cache
 from typing import Any, Dict, Generator, Optional
 
 from rich import box, markdown, prompt, table  # type: ignore
@@ -227,24 +228,34 @@ In this example here is how they will be distributed:
 """
 
 
-# Define all initial settings
-setup = BootstrapSetup(
-    expiration={
-        Roles.ROOT: 365,
-        Roles.TARGETS: 365,
-        Roles.SNAPSHOT: 1,
-        Roles.TIMESTAMP: 1,
-        Roles.BINS: 1,
-    },
-    number_of_keys={Roles.ROOT: 2, Roles.TARGETS: 1},
-    threshold={
-        Roles.ROOT: 1,
-        Roles.TARGETS: 1,
-    },
-    number_of_delegated_bins=256,
-    root_keys={},
-    online_key=RSTUFKey(),
-)
+@lru_cache(maxsize=None)
+def _md(text: str) -> markdown.Markdown:
+    """Parse the Markdown 'text' only once per process"""
+    return markdown.Markdown(text)
+
+
+def _new_setup() -> BootstrapSetup:
+    """Define all initial settings"""
+    return BootstrapSetup(
+        expiration={
+            Roles.ROOT: 365,
+            Roles.TARGETS: 365,
+            Roles.SNAPSHOT: 1,
+            Roles.TIMESTAMP: 1,
+            Roles.BINS: 1,
+        },
+        number_of_keys={Roles.ROOT: 2, Roles.TARGETS: 1},
+        threshold={
+            Roles.ROOT: 1,
+            Roles.TARGETS: 1,
+        },
+        number_of_delegated_bins=256,
+        root_keys={},
+        online_key=RSTUFKey(),
+    )
+
+
+setup = _new_setup()
 
 
 def _key_already_in_use(key: Dict[str, Any]) -> bool:
@@ -264,11 +275,11 @@ def _key_already_in_use(key: Dict[str, Any]) -> bool:
 
 def _configure_role_target():
     console.print("\n")
-    console.print(markdown.Markdown(BINS_DELEGATION_MESSAGE), width=100)
+    console.print(_md(BINS_DELEGATION_MESSAGE), width=100)
     show_example = prompt.Confirm.ask("Show example?", default="y")
     if show_example:
         with console.pager(links=True):
-            console.print(markdown.Markdown(HASH_BINS_EXAMPLE), width=100)
+            console.print(_md(HASH_BINS_EXAMPLE), width=100)
 
     setup.number_of_delegated_bins = prompt.IntPrompt.ask(
         "\nChoose the number of delegated hash bin roles",
@@ -306,9 +317,7 @@ def _configure_role_root():
 
 
 def _configure_role(role: Roles) -> None:
-    console.print(
-        markdown.Markdown(f"## {role.value} configuration"), width=100
-    )
+    console.print(_md(f"## {role.value} configuration"), width=100)
     role_expiration = 0
     while True:
         role_expiration = prompt.IntPrompt.ask(
@@ -475,6 +484,54 @@ def _run_user_validation():
             f"[yellow]{key.key.get('scheme')}[/]",
         )
 
+    def _render_role_summary(role: Roles) -> table.Table:
+        """Gets a new role summary table"""
+        role_table = _init_summary_table("ROLE SUMMARY")
+        role_table.add_column("KEYS", justify="center", vertical="middle")
+
+        if role == Roles.ROOT:
+            keys_table = _init_keys_table()
+            for key in setup.root_keys.values():
+                _add_row_keys_table(keys_table, key, "Offline")
+
+            role_table.add_row(
+                (
+                    f"Role: [cyan]{role.value}[/]"
+                    f"\nNumber of Keys: [yellow]{len(setup.root_keys)}[/]"
+                    f"\nThreshold: [yellow]{setup.threshold[Roles.ROOT]}"
+                    "[/]"
+                    f"\nRole Expiration: [yellow]{setup.expiration[role]} "
+                    "[/]days"
+                ),
+                keys_table,
+            )
+        else:
+            keys_table = _init_keys_table(path=False)
+            if setup.online_key.key is not None:
+                _add_row_keys_table(keys_table, setup.online_key, "Online")
+
+            role_table.add_row(
+                (
+                    f"Role: [cyan]{role.value}[/]"
+                    f"\nRole Expiration: [yellow]{setup.expiration[role]} "
+                    "[/]days"
+                ),
+                keys_table,
+            )
+
+        if role == Roles.TARGETS:
+            role_table.add_row(
+                (
+                    "\n[orange1]DELEGATIONS[/]"
+                    f"\n[aquamarine3]{role.value} -> bins[/]"
+                    "\nNumber of bins: "
+                    f"[yellow]{setup.number_of_delegated_bins}[/]"
+                ),
+                "",
+            )
+
+        return role_table
+
     # Validations
     #
     # Online key validation
@@ -499,52 +556,11 @@ def _run_user_validation():
             break
 
     # Roles validation
+    #
+    # The summary table is only rebuilt when the role is reconfigured.
     for role in Roles:
+        role_table = _render_role_summary(role)
         while True:
-            role_table = _init_summary_table("ROLE SUMMARY")
-            role_table.add_column("KEYS", justify="center", vertical="middle")
-
-            if role == Roles.ROOT:
-                keys_table = _init_keys_table()
-                for key in setup.root_keys.values():
-                    _add_row_keys_table(keys_table, key, "Offline")
-
-                role_table.add_row(
-                    (
-                        f"Role: [cyan]{role.value}[/]"
-                        f"\nNumber of Keys: [yellow]{len(setup.root_keys)}[/]"
-                        f"\nThreshold: [yellow]{setup.threshold[Roles.ROOT]}"
-                        "[/]"
-                        f"\nRole Expiration: [yellow]{setup.expiration[role]} "
-                        "[/]days"
-                    ),
-                    keys_table,
-                )
-            else:
-                keys_table = _init_keys_table(path=False)
-                if setup.online_key.key is not None:
-                    _add_row_keys_table(keys_table, setup.online_key, "Online")
-
-                role_table.add_row(
-                    (
-                        f"Role: [cyan]{role.value}[/]"
-                        f"\nRole Expiration: [yellow]{setup.expiration[role]} "
-                        "[/]days"
-                    ),
-                    keys_table,
-                )
-
-            if role == Roles.TARGETS:
-                role_table.add_row(
-                    (
-                        "\n[orange1]DELEGATIONS[/]"
-                        f"\n[aquamarine3]{role.value} -> bins[/]"
-                        "\nNumber of bins: "
-                        f"[yellow]{setup.number_of_delegated_bins}[/]"
-                    ),
-                    "",
-                )
-
             console.print("\n", role_table)
             confirm_config = prompt.Confirm.ask(
                 f"\nIs the [cyan]{role.value}[/] [yellow]configuration[/] "
@@ -562,12 +578,20 @@ def _run_user_validation():
                         setup.number_of_keys[Roles.ROOT],
                     ):
                         setup.root_keys[key.key["keyid"]] = key
+
+                role_table = _render_role_summary(role)
             else:
                 break
 
 
 def _run_ceremony_steps(save: bool) -> Dict[str, Any]:
-    console.print(markdown.Markdown(CEREMONY_INTRO), width=100)
+    # Each ceremony starts from the initial settings, so keys and settings
+    # from a previous run in the same process are neither reused nor kept
+    # alive.
+    global setup
+    setup = _new_setup()
+
+    console.print(_md(CEREMONY_INTRO), width=100)
 
     ceremony_detailed = prompt.Confirm.ask(
         "\nDo you want more information about roles and responsibilities?"
@@ -575,7 +599,7 @@ def _run_ceremony_steps(save: bool) -> Dict[str, Any]:
     if ceremony_detailed is True:
         with console.pager():
             console.print(
-                markdown.Markdown(CEREMONY_INTRO_ROLES_RESPONSIBILITIES),
+                _md(CEREMONY_INTRO_ROLES_RESPONSIBILITIES),
                 width=100,
             )
 
@@ -585,12 +609,12 @@ def _run_ceremony_steps(save: bool) -> Dict[str, Any]:
         raise click.ClickException("Ceremony aborted.")
 
     # STEP 1: configure the roles settings (keys, threshold, expiration)
-    console.print(markdown.Markdown(STEP_1), width=80)
+    console.print(_md(STEP_1), width=80)
     for role in Roles:
         _configure_role(role)
 
     # STEP 2: configure the online key (one)
-    console.print(markdown.Markdown(STEP_2), width=100)
+    console.print(_md(STEP_2), width=100)
     for key in _configure_keys("ONLINE", number_of_keys=1):
         setup.online_key = key
 
@@ -601,13 +625,13 @@ def _run_ceremony_steps(save: bool) -> Dict[str, Any]:
         raise click.ClickException("Ceremony aborted.")
 
     # STEP 3: load the root keys
-    console.print(markdown.Markdown(STEP_3), width=100)
+    console.print(_md(STEP_3), width=100)
     root = Roles.ROOT.value
     for key in _configure_keys(root, setup.number_of_keys[Roles.ROOT]):
         setup.root_keys[key.key["keyid"]] = key
 
     # STEP 4: user validation
-    console.print(markdown.Markdown(STEP_4), width=100)
+    console.print(_md(STEP_4), width=100)
     _run_user_validation()
 
     tuf_management = TUFManagement(setup, save)
@@ -27,7 +27,7 @@ def _decode_trusted_root(root) -> str:
 def _build_metadata_dir(metadata_url: str) -> str:
     """build a unique and reproducible directory name for the repository url"""
     name = sha256(metadata_url.encode()).hexdigest()[:8]
-    return f"{Path.home()}/.local/share/rstuf/{name}"
+    return os.path.join(Path.home(), ".local", "share", "rstuf", name)
 
 
 def _init_tofu(metadata_url: str, root: Optional[str]) -> None:
@@ -42,7 +42,8 @@ def _init_tofu(metadata_url: str, root: Optional[str]) -> None:
     try:
         parsed_root = urlparse(root)
         if parsed_root.scheme and parsed_root.netloc:
-            request.urlretrieve(root, f"{metadata_dir}/root.json")  # nosec
+            root_path = os.path.join(metadata_dir, "root.json")
+            request.urlretrieve(root, root_path)  # nosec
         else:
             console.print(  # pragma: no cover
                 f"Failed to parse {root}: ",
@@ -114,11 +115,12 @@ def _download_artifact(
     if artifacts_url is None:
         raise click.ClickException("Please specify artifacts url")
 
-    if not os.path.isfile(f"{metadata_dir}/root.json"):
+    trusted_root_path = os.path.join(metadata_dir, "root.json")
+    if not os.path.isfile(trusted_root_path):
         console.print(
             "Trusted local root not found. Using 'tofu' to "
-            "Trust-On-First-Use or copy trusted root metadata to "
-            f"{metadata_dir}/root.json"
+            "Trust-On-First-Use or copy trusted root metadata "
+            f"to {trusted_root_path}"
         )
         _init_tofu(metadata_url, root)
 
@@ -129,7 +131,7 @@ def _download_artifact(
         # recognize that properly
         download_dir = directory_prefix  # pragma: no cover
     else:
-        download_dir = os.getcwd() + "/downloads"
+        download_dir = os.path.join(os.getcwd(), "downloads")
 
     if not os.path.isdir(download_dir):
         os.makedirs(download_dir, exist_ok=True)
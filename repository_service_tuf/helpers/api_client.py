@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2022-2023 VMware Inc
 #
 # SPDX-License-Identifier: MIT
+import random
 import time
 from enum import Enum
 from typing import Any, Dict, Optional
@@ -14,6 +15,11 @@ from tuf.api.metadata import Metadata
 
 console = Console()
 
+# Task status polling: wait between requests grows exponentially from the min
+# to the max delay (seconds), and restarts from the min when the state changes
+TASK_POLL_MIN_DELAY = 0.25
+TASK_POLL_MAX_DELAY = 5.0
+
 
 class URL(Enum):
     BOOTSTRAP = "api/v1/bootstrap/"
@@ -40,10 +46,13 @@ def request_server(
     payload: Optional[Dict[str, Any]] = None,
     data: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, str]] = None,
+    session: Optional[requests.Session] = None,
 ) -> requests.Response:
+    # A session reuses the underlying connection across multiple requests
+    requester: Any = session if session is not None else requests
     try:
         if method == Methods.GET:
-            response = requests.get(
+            response = requester.get(
                 f"{server}/{url}",
                 json=payload,
                 data=data,
@@ -52,7 +61,7 @@ def request_server(
             )
 
         elif method == Methods.POST:
-            response = requests.post(
+            response = requester.post(
                 f"{server}/{url}",
                 json=payload,
                 data=data,
@@ -61,7 +70,7 @@ def request_server(
             )
 
         elif method == Methods.DELETE:
-            response = requests.delete(
+            response = requester.delete(
                 f"{server}/{url}",
                 json=payload,
                 data=data,
@@ -105,64 +114,73 @@ def task_status(
     silent: Optional[bool] = False,
 ) -> Dict[str, Any]:
     received_states = []
-    while True:
-        state_response = request_server(
-            settings.SERVER,
-            f"{URL.TASK.value}{task_id}",
-            Methods.GET,
-        )
-
-        if state_response.status_code != 200:
-            raise click.ClickException(
-                f"Unexpected response {state_response.text}"
+    delay = TASK_POLL_MIN_DELAY
+    # Poll using a single session, so all requests share one connection
+    with requests.Session() as session:
+        while True:
+            state_response = request_server(
+                settings.SERVER,
+                f"{URL.TASK.value}{task_id}",
+                Methods.GET,
+                session=session,
             )
 
-        data = state_response.json().get("data")
+            if state_response.status_code != 200:
+                raise click.ClickException(
+                    f"Unexpected response {state_response.text}"
+                )
 
-        if data:
-            if state := data.get("state"):
-                if state not in received_states:
-                    if silent is False:
-                        console.print(f"{title} {state}")
-                    received_states.append(state)
-                else:
-                    if silent is False:
-                        console.print(".", end="")
+            data = state_response.json().get("data")
 
-                if state == "SUCCESS":
-                    if result := data.get("result"):
-                        if result.get("status") is True:
-                            return data
+            if data:
+                if state := data.get("state"):
+                    if state not in received_states:
+                        if silent is False:
+                            console.print(f"{title} {state}")
+                        received_states.append(state)
+                        delay = TASK_POLL_MIN_DELAY
+                    else:
+                        if silent is False:
+                            console.print(".", end="")
+
+                    if state == "SUCCESS":
+                        if result := data.get("result"):
+                            if result.get("status") is True:
+                                return data
+                            else:
+                                raise click.ClickException(
+                                    "Task status is not successful: "
+                                    f"{state_response.text}"
+                                )
                         else:
                             raise click.ClickException(
-                                "Task status is not successful: "
+                                "No result received in data "
                                 f"{state_response.text}"
                             )
-                    else:
+
+                    elif state == "FAILURE":
                         raise click.ClickException(
-                            f"No result received in data {state_response.text}"
+                            f"Failed: {state_response.text}"
+                        )
+                    elif state == "ERRORED":
+                        # If task.state is "ERRORED" it means there is an
+                        # internal RSTUF error and data contains error
+                        # information.
+                        raise click.ClickException(
+                            f"Errored: {data['result']['error']}"
                         )
 
-                elif state == "FAILURE":
-                    raise click.ClickException(
-                        f"Failed: {state_response.text}"
-                    )
-                elif state == "ERRORED":
-                    # If task.state is "ERRORED" it means there is an internal
-                    # RSTUF error and data contains error information.
+                else:
                     raise click.ClickException(
-                        f"Errored: {data['result']['error']}"
+                        f"No state in data received {state_response.text}"
                     )
-
             else:
                 raise click.ClickException(
-                    f"No state in data received {state_response.text}"
+                    f"No data received {state_response.text}"
                 )
-        else:
-            raise click.ClickException(
-                f"No data received {state_response.text}"
-            )
-        time.sleep(2)
+            # Small jitter avoids many clients polling in lockstep
+            time.sleep(delay + random.uniform(0, 0.1))  # nosec
+            delay = min(delay * 2, TASK_POLL_MAX_DELAY)
 
 
 def publish_artifacts(settings: LazySettings) -> str:
@@ -1,10 +1,12 @@
 # SPDX-License-Identifier: MIT
 
 import hashlib
+import io
 import os
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class PayloadArtifactsHashes(str, Enum):
@@ -25,6 +27,13 @@ class ArtifactInfo:
     hashes: Dict[PayloadArtifactsHashes, str]
     custom: Optional[Dict[str, Any]]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "length": self.length,
+            "hashes": {k.value: v for k, v in self.hashes.items()},
+            "custom": self.custom,
+        }
+
 
 @dataclass
 class Artifact:
@@ -33,6 +42,9 @@ class Artifact:
     info: ArtifactInfo
     path: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"info": self.info.to_dict(), "path": self.path}
+
 
 @dataclass
 class AddPayload:
@@ -44,8 +56,12 @@ class AddPayload:
     # Whether to publish the artifacts
     publish_artifacts: bool = True
 
-    def to_dict(self):
-        return asdict(self)
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "artifacts": [artifact.to_dict() for artifact in self.artifacts],
+            "add_task_id_to_custom": self.add_task_id_to_custom,
+            "publish_artifacts": self.publish_artifacts,
+        }
 
 
 @dataclass
@@ -54,8 +70,50 @@ class DeletePayload:
 
     artifacts: List[str]
 
-    def to_dict(self):
-        return asdict(self)
+    def to_dict(self) -> Dict[str, Any]:
+        return {"artifacts": list(self.artifacts)}
+
+
+# Read files in 1 MiB chunks when hashing so the per-call overhead of
+# `hasher.update` is amortized over large artifacts.
+HASH_CHUNK_SIZE: int = 1024 * 1024
+
+
+def _blake2b_256_file(file: io.BufferedReader) -> str:
+    """Calculate the blake2b-256 hash of an open binary file object"""
+
+    # Python >= 3.11 hashes the file object directly in C.
+    if hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(
+            file, lambda: hashlib.blake2b(digest_size=32)
+        ).hexdigest()
+
+    # Using non-default digest size of 32 for blake2b-256
+    hasher = hashlib.blake2b(digest_size=32)
+
+    # We calculate the hash of the file in chunks as to not load it all
+    # at once in memory. Reading into a single preallocated buffer
+    # avoids allocating a new bytes object per chunk.
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    while size := file.readinto(buffer):
+        hasher.update(view[:size])
+
+    return hasher.hexdigest()
+
+
+def calculate_length_and_blake2b_256(filepath: str) -> Tuple[int, str]:
+    """Calculate the length and blake2b-256 hash of the given file
+
+    Both values are taken from the same open file, so they always describe
+    the same file state.
+
+    :param filepath: The file path to calculate the length and hash.
+    """
+
+    with open(filepath, "rb") as file:
+        length = os.fstat(file.fileno()).st_size
+        return length, _blake2b_256_file(file)
 
 
 def calculate_blake2b_256(filepath: str) -> str:
@@ -64,19 +122,38 @@ def calculate_blake2b_256(filepath: str) -> str:
     :param filepath: The file path to calculate the hash.
     """
 
-    # Using non-default digest size of 32 for blake2b-256
-    hasher = hashlib.blake2b(digest_size=32)
+    with open(filepath, "rb") as file:
+        return _blake2b_256_file(file)
 
-    # 8kB chunk size
-    chunk_size_bytes = 8 * 1024
 
-    with open(filepath, "rb") as file:
-        # We calculate the hash of the file in chunks as to not load it all
-        # at once in memory.
-        for chunk in iter(lambda: file.read(chunk_size_bytes), b""):
-            hasher.update(chunk)
+def calculate_blake2b_256_many(
+    filepaths: List[str], max_workers: Optional[int] = None
+) -> List[str]:
+    """Calculate the blake2b-256 hash of several files in parallel
 
-    return hasher.hexdigest()
+    hashlib releases the GIL while hashing, so a thread pool spreads the
+    work across cores.
+
+    :param filepaths: The file paths to calculate the hashes.
+    :param max_workers: Maximum number of threads, defaults to CPU count.
+    """
+
+    if len(filepaths) < 2:
+        return [calculate_blake2b_256(filepath) for filepath in filepaths]
+
+    workers = min(len(filepaths), max_workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(calculate_blake2b_256, filepaths))
+
+
+def _artifact_payload_path(filepath: str, path: Optional[str]) -> str:
+    """Join the artifact file name with the optional metadata path."""
+
+    filename = os.path.basename(filepath)
+    if path:
+        return f"{path.rstrip('/')}/{filename}"
+
+    return filename
 
 
 def create_artifact_add_payload_from_filepath(
@@ -90,13 +167,9 @@ def create_artifact_add_payload_from_filepath(
     :param path: The path defined in the metadata for the artifact.
     """
 
-    length: int = os.path.getsize(filepath)
-    blake2b_256_hash: str = calculate_blake2b_256(filepath)
+    length, blake2b_256_hash = calculate_length_and_blake2b_256(filepath)
 
-    if path:
-        payload_path = f"{path.rstrip('/')}/{filepath.split('/')[-1]}"
-    else:
-        payload_path = f"{filepath.split('/')[-1]}"
+    payload_path = _artifact_payload_path(filepath, path)
 
     payload = AddPayload(
         artifacts=[
@@ -123,10 +196,7 @@ def create_artifact_delete_payload_from_filepath(
     Create the payload for the API request of `POST api/v1/artifacts/delete`.
     """
 
-    if path:
-        payload_path = f"{path.rstrip('/')}/{filepath.split('/')[-1]}"
-    else:
-        payload_path = f"{filepath.split('/')[-1]}"
+    payload_path = _artifact_payload_path(filepath, path)
 
     payload = DeletePayload(artifacts=[payload_path])
 
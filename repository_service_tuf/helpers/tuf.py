@@ -5,6 +5,7 @@
 import base64
 import copy
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -37,6 +38,8 @@ console = Console()
 
 SPEC_VERSION: str = ".".join(SPECIFICATION_VERSION)
 BINS: str = "bins"
+# Buffer size used for reading/writing payload files
+PAYLOAD_BUFFER_SIZE: int = 64 * 1024
 
 
 class Roles(Enum):
@@ -47,6 +50,15 @@ class Roles(Enum):
     BINS = "bins"
 
 
+# Top-level roles, in the order they are added to the root metadata
+_TOP_LEVEL_ROLES: Tuple[Roles, ...] = (
+    Roles.ROOT,
+    Roles.TIMESTAMP,
+    Roles.SNAPSHOT,
+    Roles.TARGETS,
+)
+
+
 @dataclass
 class RSTUFKey:
     key: dict = field(default_factory=dict)
@@ -78,19 +90,12 @@ class BootstrapSetup:
     online_key: RSTUFKey = field(default_factory=RSTUFKey)
 
     def to_dict(self) -> Dict[str, Any]:
-        result: Dict[str, Any] = {"roles": {}}
-        for role in Roles:
-            if role.value == BINS:
-                result["roles"][BINS] = {
-                    "expiration": self.expiration[role],
-                    "number_of_delegated_bins": self.number_of_delegated_bins,
-                }
-            else:
-                result["roles"][role.value] = {
-                    "expiration": self.expiration[role],
-                }
+        roles: Dict[str, Dict[str, int]] = {
+            role.value: {"expiration": self.expiration[role]} for role in Roles
+        }
+        roles[BINS]["number_of_delegated_bins"] = self.number_of_delegated_bins
 
-        return result
+        return {"roles": roles}
 
 
 class MetadataInfo:
@@ -420,13 +425,14 @@ class TUFManagement:
         # required signature thresholds for each top-level role in 'root'.
         roles: dict[str, Role] = {}
         add_key_args: Dict[str, List[Key]] = {}
-        for role_name in ["root", "timestamp", "snapshot", "targets"]:
-            if role_name == Roles.ROOT.value:
+        for role in _TOP_LEVEL_ROLES:
+            role_name = role.value
+            if role == Roles.ROOT:
                 threshold = self.setup.threshold[Roles.ROOT]
             else:
                 threshold = 1
 
-            public_keys = self._public_keys(Roles[role_name.upper()])
+            public_keys = self._public_keys(role)
             add_key_args[role_name] = []
             roles[role_name] = Role([], threshold)
             for securesystemslib_key in public_keys:
@@ -498,6 +504,13 @@ def get_key(
 
 def load_key(path: str, keytype: str, password: str, name: str) -> RSTUFKey:
     """Load a securesystemslib private key file into an RSTUFKey object"""
+    # Fail fast on a missing or empty file instead of attempting to decrypt
+    if not os.path.isfile(path):
+        return RSTUFKey(error=":cross_mark: [red]Failed[/]: File not found.")
+
+    if os.path.getsize(path) == 0:
+        return RSTUFKey(error=":cross_mark: [red]Failed[/]: Empty key file.")
+
     try:
         key = import_privatekey_from_file(path, keytype, password)
         # Make sure name cannot be an empty string.
@@ -519,8 +532,8 @@ def load_key(path: str, keytype: str, password: str, name: str) -> RSTUFKey:
 def load_payload(path: str) -> Dict[str, Any]:
     """Load existing payload file."""
     try:
-        with open(path) as payload_data:
-            payload = json.load(payload_data)
+        with open(path, "rb", buffering=PAYLOAD_BUFFER_SIZE) as payload_data:
+            payload = json.loads(payload_data.read())
     except OSError as err:
         raise click.ClickException(f"Error to load {path}. {str(err)}")
 
@@ -533,8 +546,8 @@ def save_payload(file_path: str, payload: Dict[str, Any]):
     if not file_path.endswith(".json"):
         file_path += ".json"
     try:
-        with open(file_path, "w") as f:
-            f.write(json.dumps(payload, indent=2))
+        with open(file_path, "w", buffering=PAYLOAD_BUFFER_SIZE) as f:
+            json.dump(payload, f, indent=2)
     except OSError as err:
         raise click.ClickException(f"Failed to save {file_path}. {str(err)}")
 
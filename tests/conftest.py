@@ -61,7 +61,9 @@ def _create_client() -> CliRunner:
     return CliRunner(mix_stderr=False)
 
 
-@pytest.fixture
+# CliRunner keeps no state between invocations, so one runner is shared by
+# the whole test session.
+@pytest.fixture(scope="session")
 def client() -> CliRunner:
     return _create_client()
 
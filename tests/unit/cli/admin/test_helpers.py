@@ -356,3 +356,46 @@ class TestHelpers:
                 options=["option1", "option2"], cursor=">", cursor_style="cyan"
             )
         ]
+
+    def test_ceremony_payload_to_dict(self):
+        roles = helpers.Roles(
+            helpers.Role(365),
+            helpers.Role(1),
+            helpers.Role(1),
+            helpers.Role(365),
+            helpers.BinsRole(1, 256),
+        )
+        root = Metadata(Root()).to_dict()
+        payload = helpers.CeremonyPayload(
+            helpers.Settings(roles), helpers.Metadatas(root)
+        )
+
+        assert payload.to_dict() == {
+            "settings": {
+                "roles": {
+                    "root": {"expiration": 365},
+                    "timestamp": {"expiration": 1},
+                    "snapshot": {"expiration": 1},
+                    "targets": {"expiration": 365},
+                    "bins": {
+                        "expiration": 1,
+                        "number_of_delegated_bins": 256,
+                    },
+                }
+            },
+            "metadata": {"root": root},
+        }
+
+    def test_update_payload_to_dict(self):
+        root = Metadata(Root()).to_dict()
+        payload = helpers.UpdatePayload(helpers.Metadatas(root))
+
+        assert payload.to_dict() == {"metadata": {"root": root}}
+
+    def test_sign_payload_to_dict(self):
+        payload = helpers.SignPayload(signature={"keyid": "k", "sig": "s"})
+
+        assert payload.to_dict() == {
+            "signature": {"keyid": "k", "sig": "s"},
+            "role": "root",
+        }
@@ -70,6 +70,28 @@ class TestCeremonyInteraction:
         assert "Ceremony aborted." in test_result.stderr
         assert test_result.exit_code == 1
 
+    def test_ceremony_starts_from_initial_settings(
+        self, client, test_context, test_setup, test_inputs
+    ):
+        # settings left over from a previous run in the same process
+        test_setup.root_keys["ema"] = ceremony.RSTUFKey(key={"keyid": "ema"})
+        test_setup.number_of_delegated_bins = 16
+        ceremony.setup = test_setup
+        input_step1, _, _, _ = test_inputs
+        # overwrite step 1
+        # >Do you want to start the ceremony?
+        input_step1[1] = "n"
+
+        test_result = client.invoke(
+            ceremony.ceremony,
+            input="\n".join(input_step1),
+            obj=test_context,
+        )
+        assert test_result.exit_code == 1
+        assert ceremony.setup is not test_setup
+        assert ceremony.setup.root_keys == {}
+        assert ceremony.setup.number_of_delegated_bins == 256
+
     def test_ceremony_start_not_ready_load_the_keys(
         self, client, test_context, test_inputs
     ):
@@ -87,9 +109,8 @@ class TestCeremonyInteraction:
         assert test_result.exit_code == 1
 
     def test_ceremony_problem_loading_priv_key_fix_and_continue(
-        self, client, test_context, test_setup, test_inputs
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, _, input_step4 = test_inputs
 
         input_step3 = [
@@ -127,9 +148,8 @@ class TestCeremonyInteraction:
         assert "strongPass" not in test_result.output
 
     def test_ceremony_start_default_values(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         test_result = client.invoke(
@@ -148,9 +168,8 @@ class TestCeremonyInteraction:
         assert "strongPass" not in test_result.output
 
     def test_ceremony_using_root_key2_public_key(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, _, input_step4 = test_inputs
 
         input_step3 = [
@@ -183,9 +202,8 @@ class TestCeremonyInteraction:
         assert "strongPass" not in test_result.output
 
     def test_ceremony_using_root_key2_public_key_empty_retry(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, _, input_step4 = test_inputs
 
         input_step3 = [
@@ -220,9 +238,8 @@ class TestCeremonyInteraction:
         assert "strongPass" not in test_result.output
 
     def test_ceremony_negative_expiry_and_try_again(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
         # Adding two additional questions for root expiry because the last
         # given values for the root expiration are below 1.
@@ -259,9 +276,8 @@ class TestCeremonyInteraction:
         assert "strongPass" not in test_result.output
 
     def test_ceremony_key_bad_input_try_again(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         # overwrite the input_step2
@@ -296,11 +312,8 @@ class TestCeremonyInteraction:
         # passwords not shown in output
         assert "strongPass" not in test_result.output
 
-    def test_ceremony_key_with_name(
-        self, client, test_context, test_inputs, test_setup
-    ):
+    def test_ceremony_key_with_name(self, client, test_context, test_inputs):
         # Test a case when the user gives custom names to the keys.
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         # update all: [Optional] Give a name/tag to the root`s key
@@ -323,9 +336,8 @@ class TestCeremonyInteraction:
         assert "strongPass" not in test_result.output
 
     def test_ceremony_key_duplicated_try_again_yes(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         # overwrite the input_step3 with same key in input_step2 (online key)
@@ -361,9 +373,8 @@ class TestCeremonyInteraction:
         assert "strongPass" not in test_result.output
 
     def test_ceremony_validation_reconfigure_online_key(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         # overwrite the step 4
@@ -398,9 +409,8 @@ class TestCeremonyInteraction:
         assert "strongPass" not in test_result.output
 
     def test_ceremony_online_key_non_ed25519_key_type(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         # overwrite the step 4
@@ -435,9 +445,8 @@ class TestCeremonyInteraction:
         assert "strongPass" not in test_result.output
 
     def test_ceremony_validation_reconfigure_root_keys(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         # overwrite the step 4
@@ -475,9 +484,8 @@ class TestCeremonyInteraction:
         assert "strongPass" not in test_result.output
 
     def test_ceremony_pending_signatures(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
         # Setting threshold to a high value to guarantee there are stil
         # signatures needed to finish the bootstrap process
@@ -513,9 +521,8 @@ class TestCeremonyInteraction:
         assert "Ceremony done. 🔐 🎉." in test_result.output
 
     def test_ceremony_keys_less_than_a_threshold(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
         # Setting threshold to a high value to guarantee there are stil
         # signatures needed to finish the bootstrap process
@@ -567,9 +574,8 @@ class TestCeremonyOptions:
     """Test the options"""
 
     def test_ceremony_option_save(
-        self, client, test_context, test_inputs, test_setup, monkeypatch
+        self, client, test_context, test_inputs, monkeypatch
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         monkeypatch.setattr(
@@ -609,9 +615,8 @@ class TestCeremonyOptions:
         ]
 
     def test_ceremony_option_timeout(
-        self, client, test_context, test_inputs, test_setup, monkeypatch
+        self, client, test_context, test_inputs, monkeypatch
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         monkeypatch.setattr(
@@ -651,9 +656,8 @@ class TestCeremonyOptions:
         ]
 
     def test_ceremony_option_save_OSError(
-        self, client, test_context, test_inputs, test_setup, monkeypatch
+        self, client, test_context, test_inputs, monkeypatch
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         monkeypatch.setattr(
@@ -678,9 +682,8 @@ class TestCeremonyOptions:
         assert "permission denied" in test_result.stderr
 
     def test_ceremony_option_bootstrap(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         ceremony.bootstrap_status = pretend.call_recorder(
@@ -731,9 +734,8 @@ class TestCeremonyOptions:
         ]
 
     def test_ceremony_option_bootstrap_server_already_bootstrap(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         ceremony.bootstrap_status = pretend.call_recorder(
@@ -818,9 +820,8 @@ class TestCeremonyOptions:
         assert "Requires '--api-server'" in test_result.stderr
 
     def test_ceremony_option_upload_missing_bootstrap(
-        self, client, test_context, test_inputs, test_setup
+        self, client, test_context, test_inputs
     ):
-        ceremony.setup = test_setup
         input_step1, input_step2, input_step3, input_step4 = test_inputs
 
         ceremony.bootstrap_status = pretend.call_recorder(
@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: MIT
 
+import base64
 import os
-from hashlib import sha256
+from pathlib import Path
+from typing import Any, Dict, Optional
+from unittest import mock
 
-import pretend
 import pytest
 from tuf.ngclient import UpdaterConfig
 
@@ -12,16 +14,87 @@ from repository_service_tuf.cli.artifact import download
 METADATA_URL = "http://localhost:8080"
 ARTIFACT_URL = "http://localhost:8081"
 ARTIFACT_NAME = "file.txt"
+ROOT_URL = "http://localhost:8080/2.root.json"
 SRC_PATH = "repository_service_tuf.cli.artifact.download"
+# Default download directory used by `_download_artifact`
+DOWNLOADS_DIR = str(Path.cwd() / "downloads")
+# First 8 hex digits of sha256(b"http://example.org")
+METADATA_URL_HASH = "971a565c"
+# A repository entry of the config file, shared read-only by the tests
+REPOSITORY_CONFIG = {
+    "artifact_base_url": ARTIFACT_URL,
+    "hash_prefix": "false",
+    "metadata_url": METADATA_URL,
+    "trusted_root": "some_root",
+}
+
+
+@pytest.fixture(autouse=True)
+def mocked_os_makedirs(monkeypatch):
+    """Keep every download test from creating directories on disk"""
+    monkeypatch.setattr(f"{SRC_PATH}.os.makedirs", lambda *a, **kw: None)
 
 
-@pytest.fixture()
-def mocked_os_makedirs(monkeypatch):
-    fake_makedirs = pretend.call_recorder(lambda *a, **kw: None)
-    path = "repository_service_tuf.cli.artifact.download.os.makedirs"
-    monkeypatch.setattr(path, fake_makedirs)
+@pytest.fixture(autouse=True)
+def no_network(monkeypatch):
+    """Fail loudly if a download test reaches out to the network"""
+
+    def fake_urlretrieve(url, *a, **kw):
+        raise AssertionError(f"Unexpected network access to {url}")
+
+    monkeypatch.setattr(f"{SRC_PATH}.request.urlretrieve", fake_urlretrieve)
 
-    return fake_makedirs
+
+def _patch_updater_config(
+    monkeypatch, conf: Optional[UpdaterConfig] = None
+) -> UpdaterConfig:
+    """Make the download command use `conf` as its `UpdaterConfig`
+
+    A fresh config is created by default, as the command mutates it.
+    """
+    if conf is None:
+        conf = UpdaterConfig()
+    monkeypatch.setattr(
+        f"{SRC_PATH}.UpdaterConfig", mock.Mock(return_value=conf)
+    )
+
+    return conf
+
+
+def _install_happy_path(
+    monkeypatch,
+    *,
+    metadata_dir: str = "foo_dir",
+    root_exists: bool = True,
+    updater_conf: Optional[UpdaterConfig] = None,
+) -> Dict[str, Any]:
+    """Patch the download command up to the TUF ngclient call
+
+    Returns the fakes and the `UpdaterConfig` used, for assertions.
+    """
+    fake_build_metadata_dir = mock.Mock(return_value=metadata_dir)
+    monkeypatch.setattr(
+        f"{SRC_PATH}._build_metadata_dir", fake_build_metadata_dir
+    )
+    root_path = os.path.join(metadata_dir, "root.json")
+    monkeypatch.setattr(
+        f"{SRC_PATH}.os.path.isfile",
+        lambda path: root_exists and path == root_path,
+    )
+    fake_urlretrieve = mock.Mock(return_value=root_path)
+    monkeypatch.setattr(f"{SRC_PATH}.request.urlretrieve", fake_urlretrieve)
+    fake_perform = mock.Mock()
+    monkeypatch.setattr(
+        f"{SRC_PATH}._perform_tuf_ngclient_download_artifact", fake_perform
+    )
+
+    return {
+        "build_metadata_dir": fake_build_metadata_dir,
+        "urlretrieve": fake_urlretrieve,
+        "perform": fake_perform,
+        "root_path": root_path,
+        "updater_conf": _patch_updater_config(monkeypatch, updater_conf),
+    }
 
 
 class TestDownloadArtifacInteractionWithoutConfig:
@@ -30,70 +103,68 @@ class TestDownloadArtifacInteractionWithoutConfig:
     without using a config file
     """
 
-    # mocked_os_makedirs not used directly, but mocks os.makedirs
-    def test_download_command_missing_metadata_url(
-        self,
-        client,
-        test_context,
-        test_setup,
+    @pytest.mark.parametrize(
+        "args, expected_err",
+        [
+            ([ARTIFACT_NAME], "Please specify metadata url"),
+            (
+                [ARTIFACT_NAME, "-m", METADATA_URL],
+                "Please specify artifacts url",
+            ),
+        ],
+        ids=["missing_metadata_url", "missing_artifacts_url"],
+    )
+    def test_download_command_missing_url(
+        self, client, test_context, args, expected_err
     ):
-        download.setup = test_setup
         test_result = client.invoke(
             download.download,
-            ARTIFACT_NAME,
+            args,
             obj=test_context,
         )
 
-        assert "Please specify metadata url" in test_result.stderr
+        assert expected_err in test_result.stderr
         assert test_result.exit_code == 1
 
-    def test_download_command_missing_artifacts_url(
+    @pytest.mark.parametrize(
+        "root_exists, extra_args, expected_root_url, expected_output",
+        [
+            (
+                False,
+                [],
+                f"{METADATA_URL}/1.root.json",
+                [
+                    "Trusted local root not found",
+                    "Using 'tofu' to Trust-On-First-Use",
+                    "Trust-on-First-Use: Initialized new root",
+                    "Using trusted root in foo_dir",
+                ],
+            ),
+            (
+                False,
+                ["-r", ROOT_URL],
+                ROOT_URL,
+                [
+                    "Trusted local root not found",
+                    "Trust-on-First-Use: Initialized new root",
+                    "Using trusted root in foo_dir",
+                ],
+            ),
+            (True, [], None, ["Using trusted root in foo_dir"]),
+        ],
+        ids=["using_tofu", "using_tofu_with_root_url", "with_trusted_root"],
+    )
+    def test_download_command_init_root(
         self,
         client,
         test_context,
-        test_setup,
-    ):
-        download.setup = test_setup
-
-        test_result = client.invoke(
-            download.download,
-            [ARTIFACT_NAME, "-m", METADATA_URL],
-            obj=test_context,
-        )
-
-        assert "Please specify artifacts url" in test_result.stderr
-        assert test_result.exit_code == 1
-
-    def test_download_command_using_tofu(
-        self, client, test_context, test_setup, monkeypatch, mocked_os_makedirs
+        monkeypatch,
+        root_exists,
+        extra_args,
+        expected_root_url,
+        expected_output,
     ):
-        download.setup = test_setup
-        metadata_dir = "foo_dir"
-        fake_build_metadata_dir = pretend.call_recorder(lambda a: metadata_dir)
-        monkeypatch.setattr(
-            f"{SRC_PATH}._build_metadata_dir", fake_build_metadata_dir
-        )
-
-        fake_is_file = pretend.call_recorder(lambda a: False)
-        monkeypatch.setattr(f"{SRC_PATH}.os.path.isfile", fake_is_file)
-        fake_urlretrieve = pretend.call_recorder(lambda *a: "foo/root.json")
-        monkeypatch.setattr(
-            f"{SRC_PATH}.request.urlretrieve",
-            fake_urlretrieve,
-        )
-        fake__perform_tuf_ngclient_download_artifact = pretend.call_recorder(
-            lambda *a: None
-        )
-        monkeypatch.setattr(
-            f"{SRC_PATH}._perform_tuf_ngclient_download_artifact",
-            fake__perform_tuf_ngclient_download_artifact,
-        )
-        updater_conf = UpdaterConfig()
-        fake_init_updater_config = pretend.call_recorder(lambda: updater_conf)
-        monkeypatch.setattr(
-            f"{SRC_PATH}.UpdaterConfig",
-            fake_init_updater_config,
-        )
+        fakes = _install_happy_path(monkeypatch, root_exists=root_exists)
 
         test_result = client.invoke(
             download.download,
@@ -103,152 +174,94 @@ class TestDownloadArtifacInteractionWithoutConfig:
                 METADATA_URL,
                 "-a",
                 ARTIFACT_URL,
+                *extra_args,
             ],
             obj=test_context,
             catch_exceptions=False,
         )
 
-        assert "Trusted local root not found" in test_result.output
-        assert "Using 'tofu' to Trust-On-First-Use" in test_result.output
-        assert "Trust-on-First-Use: Initialized new root" in test_result.output
-        assert fake_urlretrieve.calls == [
-            pretend.call(
-                f"{METADATA_URL}/1.root.json", f"{metadata_dir}/root.json"
-            )
-        ]
-        assert fake_build_metadata_dir.calls == [
-            pretend.call(METADATA_URL),
-            pretend.call(METADATA_URL),
-        ]
-        assert fake_init_updater_config.calls == [pretend.call()]
-        assert fake__perform_tuf_ngclient_download_artifact.calls == [
-            pretend.call(
-                METADATA_URL,
-                metadata_dir,
-                ARTIFACT_URL,
-                ARTIFACT_NAME,
-                os.getcwd() + "/downloads",
-                updater_conf,
+        for msg in expected_output:
+            assert msg in test_result.output
+        if root_exists:
+            fakes["urlretrieve"].assert_not_called()
+            fakes["build_metadata_dir"].assert_called_once_with(METADATA_URL)
+        else:
+            fakes["urlretrieve"].assert_called_once_with(
+                expected_root_url, fakes["root_path"]
             )
-        ]
-        assert test_result.exit_code == 0
-
-    def test_download_command_with_trusted_root(
-        self, client, test_context, test_setup, monkeypatch, mocked_os_makedirs
-    ):
-        download.setup = test_setup
-
-        trusted_root_path = "tests/files"
-        fake_build_metadata_dir = pretend.call_recorder(
-            lambda a: trusted_root_path
-        )
-        monkeypatch.setattr(
-            f"{SRC_PATH}._build_metadata_dir", fake_build_metadata_dir
-        )
-        fake__perform_tuf_ngclient_download_artifact = pretend.call_recorder(
-            lambda *a: None
-        )
-        monkeypatch.setattr(
-            f"{SRC_PATH}._perform_tuf_ngclient_download_artifact",
-            fake__perform_tuf_ngclient_download_artifact,
-        )
-        updater_conf = UpdaterConfig()
-        fake_init_updater_config = pretend.call_recorder(lambda: updater_conf)
-        monkeypatch.setattr(
-            f"{SRC_PATH}.UpdaterConfig",
-            fake_init_updater_config,
-        )
-
-        test_result = client.invoke(
-            download.download,
-            [
-                ARTIFACT_NAME,
-                "-m",
-                METADATA_URL,
-                "-a",
-                ARTIFACT_URL,
-            ],
-            obj=test_context,
-            catch_exceptions=False,
+            # `_init_tofu` builds the metadata dir a second time
+            assert fakes["build_metadata_dir"].call_args_list == [
+                mock.call(METADATA_URL),
+                mock.call(METADATA_URL),
+            ]
+        download.UpdaterConfig.assert_called_once_with()
+        fakes["perform"].assert_called_once_with(
+            METADATA_URL,
+            "foo_dir",
+            ARTIFACT_URL,
+            ARTIFACT_NAME,
+            DOWNLOADS_DIR,
+            fakes["updater_conf"],
         )
-        assert fake_build_metadata_dir.calls == [pretend.call(METADATA_URL)]
-        expected_root_path = trusted_root_path
-        msg = f"Using trusted root in {expected_root_path}"
-        assert msg in test_result.output
-        assert fake__perform_tuf_ngclient_download_artifact.calls == [
-            pretend.call(
-                METADATA_URL,
-                trusted_root_path,
-                ARTIFACT_URL,
-                ARTIFACT_NAME,
-                os.getcwd() + "/downloads",
-                updater_conf,
-            )
-        ]
         assert test_result.exit_code == 0
 
-    def test_download_command_with_artifact_url(
-        self, client, test_context, test_setup, monkeypatch, mocked_os_makedirs
+    @pytest.mark.parametrize(
+        "artifact_path, extra_args, directory_prefix",
+        [
+            (ARTIFACT_NAME, [], None),
+            (
+                f"example_path/{ARTIFACT_NAME}",
+                ["-P", DOWNLOADS_DIR],
+                DOWNLOADS_DIR,
+            ),
+        ],
+        ids=["with_artifact_url", "with_directory_prefix"],
+    )
+    def test_download_command_passthrough(
+        self,
+        client,
+        test_context,
+        monkeypatch,
+        artifact_path,
+        extra_args,
+        directory_prefix,
     ):
-        download.setup = test_setup
-        fake_download_artifact = pretend.call_recorder(lambda *a: None)
+        fake_download_artifact = mock.Mock()
         monkeypatch.setattr(
             f"{SRC_PATH}._download_artifact", fake_download_artifact
         )
+
         test_result = client.invoke(
             download.download,
             [
-                ARTIFACT_NAME,
+                artifact_path,
                 "-m",
                 METADATA_URL,
                 "-a",
                 ARTIFACT_URL,
+                *extra_args,
             ],
             obj=test_context,
         )
-        msg = f"Successfully completed artifact download: {ARTIFACT_NAME}"
+        msg = f"Successfully completed artifact download: {artifact_path}"
         assert msg in test_result.output
         assert test_result.exit_code == 0
-        assert fake_download_artifact.calls == [
-            pretend.call(
-                METADATA_URL, ARTIFACT_URL, False, None, ARTIFACT_NAME, None
-            )
-        ]
+        fake_download_artifact.assert_called_once_with(
+            METADATA_URL,
+            ARTIFACT_URL,
+            False,
+            directory_prefix,
+            artifact_path,
+            None,
+        )
 
     def test_download_command_with_hash_prefix(
-        self, client, test_context, test_setup, monkeypatch, mocked_os_makedirs
+        self, client, test_context, monkeypatch
     ):
-        download.setup = test_setup
         artifact_path = f"example_path/{ARTIFACT_NAME}"
-        metadata_dir = "foo_dir"
-
-        def fake_is_file(path: str) -> bool:
-            if path == f"{metadata_dir}/root.json":
-                return True
-            else:
-                return False
-
-        monkeypatch.setattr(
-            f"{SRC_PATH}.os.path.isfile",
-            pretend.call_recorder(lambda a: fake_is_file(a)),
-        )
-
-        fake_build_metadata_dir = pretend.call_recorder(lambda a: metadata_dir)
-        monkeypatch.setattr(
-            f"{SRC_PATH}._build_metadata_dir", fake_build_metadata_dir
-        )
-        fake__perform_tuf_ngclient_download_artifact = pretend.call_recorder(
-            lambda *a: None
-        )
-        monkeypatch.setattr(
-            f"{SRC_PATH}._perform_tuf_ngclient_download_artifact",
-            fake__perform_tuf_ngclient_download_artifact,
-        )
-        updater_conf = UpdaterConfig(prefix_targets_with_hash=True)
-        fake_init_updater_config = pretend.call_recorder(lambda: updater_conf)
-        monkeypatch.setattr(
-            f"{SRC_PATH}.UpdaterConfig",
-            fake_init_updater_config,
+        fakes = _install_happy_path(
+            monkeypatch,
+            updater_conf=UpdaterConfig(prefix_targets_with_hash=True),
         )
 
         test_result = client.invoke(
@@ -265,89 +278,43 @@ class TestDownloadArtifacInteractionWithoutConfig:
         )
         assert "Successfully completed artifact download" in test_result.output
         assert test_result.exit_code == 0
-        assert fake_build_metadata_dir.calls == [pretend.call(METADATA_URL)]
+        fakes["build_metadata_dir"].assert_called_once_with(METADATA_URL)
         assert "Using trusted root in " in test_result.output
-        assert updater_conf.prefix_targets_with_hash is True
-        assert fake__perform_tuf_ngclient_download_artifact.calls == [
-            pretend.call(
-                METADATA_URL,
-                metadata_dir,
-                ARTIFACT_URL,
-                artifact_path,
-                os.getcwd() + "/downloads",
-                updater_conf,
-            )
-        ]
-
-    def test_download_command_with_directory_prefix(
-        self, client, test_context, test_setup, monkeypatch, mocked_os_makedirs
-    ):
-        download.setup = test_setup
-        artifact_path = f"example_path/{ARTIFACT_NAME}"
-        directory_prefix = os.getcwd() + "/downloads"
-
-        fake_download_artifact = pretend.call_recorder(lambda *a: None)
-        monkeypatch.setattr(
-            f"{SRC_PATH}._download_artifact", fake_download_artifact
-        )
-
-        test_result = client.invoke(
-            download.download,
-            [
-                artifact_path,
-                "-m",
-                METADATA_URL,
-                "-a",
-                ARTIFACT_URL,
-                "-P",
-                directory_prefix,
-            ],
-            obj=test_context,
+        assert fakes["updater_conf"].prefix_targets_with_hash is True
+        fakes["perform"].assert_called_once_with(
+            METADATA_URL,
+            "foo_dir",
+            ARTIFACT_URL,
+            artifact_path,
+            DOWNLOADS_DIR,
+            fakes["updater_conf"],
         )
-        assert "Successfully completed artifact download" in test_result.output
-        assert test_result.exit_code == 0
-        assert fake_download_artifact.calls == [
-            pretend.call(
-                METADATA_URL,
-                ARTIFACT_URL,
-                False,
-                directory_prefix,
-                artifact_path,
-                None,
-            )
-        ]
 
     def test_download_command_failed_to_download_artifact(
-        self, client, test_context, test_setup, monkeypatch, mocked_os_makedirs
+        self, client, test_context, monkeypatch
     ):
-        download.setup = test_setup
         ARTIFACT_NAME = "non-existing"
 
         metadata_dir = "foo_dir"
-        fake_build_metadata_dir = pretend.call_recorder(lambda a: metadata_dir)
+        fake_build_metadata_dir = mock.Mock(return_value=metadata_dir)
         monkeypatch.setattr(
             f"{SRC_PATH}._build_metadata_dir", fake_build_metadata_dir
         )
 
         def fake_is_file(path: str) -> bool:
-            if path == f"{metadata_dir}/root.json":
+            if path == os.path.join(metadata_dir, "root.json"):
                 return True
             else:
                 return False
 
         monkeypatch.setattr(
             f"{SRC_PATH}.os.path.isfile",
-            pretend.call_recorder(lambda a: fake_is_file(a)),
+            fake_is_file,
         )
 
-        class FakeUpdater:
-            def __init__(self, **kw):
-                pass
-
-            def refresh(self):
-                raise OSError("bad")
-
-        monkeypatch.setattr(f"{SRC_PATH}.Updater", FakeUpdater)
+        fake_updater = mock.Mock()
+        fake_updater.return_value.refresh.side_effect = OSError("bad")
+        monkeypatch.setattr(f"{SRC_PATH}.Updater", fake_updater)
 
         test_result = client.invoke(
             download.download,
@@ -363,25 +330,22 @@ class TestDownloadArtifacInteractionWithoutConfig:
         assert f"Using trusted root in {metadata_dir}" in test_result.output
         err_msg = f"Failed to download artifact {ARTIFACT_NAME}"
         assert err_msg in test_result.stderr
-        assert fake_build_metadata_dir.calls == [
-            pretend.call(METADATA_URL),
-        ]
+        fake_build_metadata_dir.assert_called_once_with(METADATA_URL)
         assert test_result.exit_code == 1
 
     def test_download_command_with_failing_tofu(
-        self, client, test_context, test_setup, monkeypatch, mocked_os_makedirs
+        self, client, test_context, monkeypatch
     ):
-        download.setup = test_setup
-        fake_build_metadata_dir = pretend.call_recorder(lambda a: "foo_dir")
+        fake_build_metadata_dir = mock.Mock(return_value="foo_dir")
         monkeypatch.setattr(
             f"{SRC_PATH}._build_metadata_dir", fake_build_metadata_dir
         )
 
-        fake_is_file = pretend.call_recorder(lambda a: False)
+        fake_is_file = mock.Mock(return_value=False)
         monkeypatch.setattr(f"{SRC_PATH}.os.path.isfile", fake_is_file)
         monkeypatch.setattr(
             f"{SRC_PATH}.request.urlretrieve",
-            pretend.raiser(OSError("Bad file")),
+            mock.Mock(side_effect=OSError("Bad file")),
         )
         test_result = client.invoke(
             download.download,
@@ -399,8 +363,11 @@ class TestDownloadArtifacInteractionWithoutConfig:
         assert "Using 'tofu' to Trust-On-First-Use" in test_result.output
         assert "Failed to download initial root from" in test_result.stderr
         assert "`tofu` was not successful" in test_result.stderr
-        assert len(fake_is_file.calls) == 2
-        assert pretend.call("foo_dir/root.json") in fake_is_file.calls
+        assert fake_is_file.call_count == 2
+        assert (
+            mock.call(os.path.join("foo_dir", "root.json"))
+            in fake_is_file.call_args_list
+        )
 
 
 class TestDownloadArtifacInteractionWithConfig:
@@ -409,46 +376,63 @@ class TestDownloadArtifacInteractionWithConfig:
     with using a config
     """
 
-    def test_download_command_no_current_repo(
-        self, client, test_context, test_setup, monkeypatch
-    ):
-        download.setup = test_setup
-        config = {
-            "REPOSITORIES": {
-                "r1": {
-                    "artifact_base_url": "http://localhost:8081",
-                    "hash_prefix": "false",
-                    "metadata_url": "http://localhost:8080",
-                    "trusted_root": "some_root",
+    @pytest.mark.parametrize(
+        "config, expected_err",
+        [
+            (
+                {
+                    "REPOSITORIES": {
+                        "r1": REPOSITORY_CONFIG,
+                    },
+                    "SERVER": "http://127.0.0.1",
                 },
-            },
-            "SERVER": "http://127.0.0.1",
-        }
-
-        test_context["settings"] = config
-        fake_is_file = pretend.call_recorder(lambda a: True)
-        monkeypatch.setattr(f"{SRC_PATH}.os.path.isfile", fake_is_file)
-
-        test_result = client.invoke(
-            download.download,
-            [ARTIFACT_NAME],
-            obj=test_context,
-        )
-        assert "Please specify current repository" in test_result.stderr
-
-    def test_download_command_no_repos_listed(
-        self, client, test_context, test_setup, monkeypatch
+                "Please specify current repository",
+            ),
+            (
+                {
+                    "CURRENT_REPOSITORY": "r1",
+                    "REPOSITORIES": {},
+                    "SERVER": "http://127.0.0.1",
+                },
+                "No reposotiroes listed in the config file",
+            ),
+            (
+                {
+                    "CURRENT_REPOSITORY": "r1_expected",
+                    "REPOSITORIES": {
+                        "r2_other": REPOSITORY_CONFIG,
+                    },
+                    "SERVER": "http://127.0.0.1",
+                },
+                "Repository r1_expected is missing in the configuration file",
+            ),
+            (
+                {
+                    "CURRENT_REPOSITORY": "r1",
+                    "REPOSITORIES": {
+                        "r1": {
+                            k: v
+                            for k, v in REPOSITORY_CONFIG.items()
+                            if k != "trusted_root"
+                        },
+                    },
+                    "SERVER": "http://127.0.0.1",
+                },
+                "Trusted root is not cofigured.",
+            ),
+        ],
+        ids=[
+            "no_current_repo",
+            "no_repos_listed",
+            "repo_is_missing",
+            "no_trusted_root",
+        ],
+    )
+    def test_download_command_config_error(
+        self, client, test_context, monkeypatch, config, expected_err
     ):
-        download.setup = test_setup
-        config = {
-            "CURRENT_REPOSITORY": "r1",
-            "REPOSITORIES": {},
-            "SERVER": "http://127.0.0.1",
-        }
-
         test_context["settings"] = config
-        fake_is_file = pretend.call_recorder(lambda a: True)
-        monkeypatch.setattr(f"{SRC_PATH}.os.path.isfile", fake_is_file)
+        monkeypatch.setattr(f"{SRC_PATH}.os.path.isfile", lambda a: True)
 
         test_result = client.invoke(
             download.download,
@@ -456,21 +440,17 @@ class TestDownloadArtifacInteractionWithConfig:
             obj=test_context,
         )
         assert test_result.exit_code == 1
-        assert (
-            "No reposotiroes listed in the config file" in test_result.stderr
-        )
+        assert expected_err in test_result.stderr
 
     def test_download_command_and_no_root_param(
-        self, client, test_context, test_setup, monkeypatch
+        self, client, test_context, monkeypatch
     ):
-        download.setup = test_setup
         config = {
             "CURRENT_REPOSITORY": "r1",
             "REPOSITORIES": {
                 "r1": {
-                    "artifact_base_url": "http://localhost:8081",
-                    "hash_prefix": "false",
-                    "metadata_url": "http://localhost:8080",
+                    **REPOSITORY_CONFIG,
+                    # base64 of "some_root"
                     "trusted_root": "c29tZV9yb290",
                 },
             },
@@ -478,12 +458,8 @@ class TestDownloadArtifacInteractionWithConfig:
         }
 
         test_context["settings"] = config
-        fake_is_file = pretend.call_recorder(lambda a: True)
-        monkeypatch.setattr(f"{SRC_PATH}.os.path.isfile", fake_is_file)
-        fake_download_artifact = pretend.call_recorder(lambda *a: None)
-        monkeypatch.setattr(
-            f"{SRC_PATH}._download_artifact", fake_download_artifact
-        )
+        monkeypatch.setattr(f"{SRC_PATH}.os.path.isfile", lambda a: True)
+        monkeypatch.setattr(f"{SRC_PATH}._download_artifact", lambda *a: None)
 
         test_result = client.invoke(
             download.download,
@@ -492,81 +468,32 @@ class TestDownloadArtifacInteractionWithConfig:
         )
         assert "Decoded trusted root some_root" in test_result.output
 
-    def test_download_command_repo_is_missing(
-        self, client, test_context, test_setup, monkeypatch
-    ):
-        download.setup = test_setup
-        config = {
-            "CURRENT_REPOSITORY": "r1_expected",
-            "REPOSITORIES": {
-                "r2_other": {
-                    "artifact_base_url": "http://localhost:8081",
-                    "hash_prefix": "false",
-                    "metadata_url": "http://localhost:8080",
-                    "trusted_root": "some_root",
-                },
-            },
-            "SERVER": "http://127.0.0.1",
-        }
-
-        test_context["settings"] = config
-        fake_is_file = pretend.call_recorder(lambda a: True)
-        monkeypatch.setattr(f"{SRC_PATH}.os.path.isfile", fake_is_file)
-
-        test_result = client.invoke(
-            download.download,
-            [ARTIFACT_NAME],
-            obj=test_context,
-        )
-        assert test_result.exit_code == 1
-        err_msg = "Repository r1_expected is missing in the configuration file"
-        assert err_msg in test_result.stderr
-
-    def test_download_command_no_trusted_root(
-        self, client, test_context, test_setup, monkeypatch
-    ):
-        download.setup = test_setup
-        config = {
-            "CURRENT_REPOSITORY": "r1",
-            "REPOSITORIES": {
-                "r1": {
-                    "artifact_base_url": "http://localhost:8081",
-                    "hash_prefix": "false",
-                    "metadata_url": "http://localhost:8080",
-                },
-            },
-            "SERVER": "http://127.0.0.1",
-        }
-
-        test_context["settings"] = config
-        fake_is_file = pretend.call_recorder(lambda a: True)
-        monkeypatch.setattr(f"{SRC_PATH}.os.path.isfile", fake_is_file)
-
-        test_result = client.invoke(
-            download.download,
-            [ARTIFACT_NAME],
-            obj=test_context,
-        )
-        assert test_result.exit_code == 1
-        assert "Trusted root is not cofigured." in test_result.stderr
-
 
 class TestDownloadArtifactOptions:
     """Test the artifact download command hepler methods"""
 
-    def test_decode_trusted_root(self):
-        trusted_root = "ZXhhbXBsZS9ob21lL3BhdGgvLmxvY2FsL3NoYXJlL3JzdHVmL3Jvb3QuanNvbg=="  # noqa
-        want = "example/home/path/.local/share/rstuf/root.json"
+    @pytest.mark.parametrize(
+        "want",
+        [
+            "example/home/path/.local/share/rstuf/root.json",
+            "/etc/rstuf/root.json",
+            "/home/usér/.local/share/rstuf/root.json",
+            "a",
+            "",
+        ],
+    )
+    def test_decode_trusted_root(self, want):
+        trusted_root = base64.b64encode(want.encode()).decode()
 
         actual = download._decode_trusted_root(trusted_root)
         assert want == actual
 
     def test_build_metadata_dir(self, monkeypatch):
         metadata_url = "http://example.org"
-        metadata_url_hash = sha256(metadata_url.encode()).hexdigest()[:8]
-        want = "example_home/.local/share/rstuf/" + metadata_url_hash
-        fake_path_home = pretend.call_recorder(lambda: "example_home")
-        monkeypatch.setattr(f"{SRC_PATH}.Path.home", fake_path_home)
+        want = os.path.join(
+            "example_home", ".local", "share", "rstuf", METADATA_URL_HASH
+        )
+        monkeypatch.setattr(f"{SRC_PATH}.Path.home", lambda: "example_home")
 
         actual = download._build_metadata_dir(metadata_url)
         assert want == actual
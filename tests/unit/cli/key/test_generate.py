@@ -146,7 +146,7 @@ class TestGenerateInteraction:
             Path(filepath).unlink(missing_ok=True)
             Path(filepath + ".pub").unlink(missing_ok=True)
 
-    def test_generate_file_overwrite(self, client) -> None:
+    def test_generate_file_overwrite(self, client, monkeypatch) -> None:
         """Test the 'overwrite file' prompt"""
 
         key_type = "rsa"
@@ -158,7 +158,11 @@ class TestGenerateInteraction:
             "n",  # Do you want to overwrite the existing 'test-filename' file?
         ]
 
-        generate.os.path.isfile = pretend.call_recorder(lambda *a, **kw: True)
+        monkeypatch.setattr(
+            generate.os.path,
+            "isfile",
+            pretend.call_recorder(lambda *a, **kw: True),
+        )
 
         generate._verify_password = pretend.call_recorder(lambda a: password)
 
@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
 import pretend
 import pytest
@@ -14,13 +14,17 @@ from repository_service_tuf.helpers import api_client
 class TestAPIClient:
     path = "repository_service_tuf.helpers.api_client"
 
-    def test_request_server_get(self):
+    def test_request_server_get(self, monkeypatch):
         fake_response = pretend.stub(
             status_code=200,
             json=pretend.call_recorder(lambda: {"key": "value"}),
         )
-        api_client.requests = pretend.stub(
-            get=pretend.call_recorder(lambda *a, **kw: fake_response)
+        monkeypatch.setattr(
+            api_client,
+            "requests",
+            pretend.stub(
+                get=pretend.call_recorder(lambda *a, **kw: fake_response)
+            ),
         )
         result = api_client.request_server(
             "http://server", "url", api_client.Methods.GET
@@ -37,13 +41,17 @@ class TestAPIClient:
             )
         ]
 
-    def test_request_server_post(self):
+    def test_request_server_post(self, monkeypatch):
         fake_response = pretend.stub(
             status_code=200,
             json=pretend.call_recorder(lambda: {"key": "value"}),
         )
-        api_client.requests = pretend.stub(
-            post=pretend.call_recorder(lambda *a, **kw: fake_response)
+        monkeypatch.setattr(
+            api_client,
+            "requests",
+            pretend.stub(
+                post=pretend.call_recorder(lambda *a, **kw: fake_response)
+            ),
         )
 
         result = api_client.request_server(
@@ -61,13 +69,17 @@ class TestAPIClient:
             )
         ]
 
-    def test_request_server_delete(self):
+    def test_request_server_delete(self, monkeypatch):
         fake_response = pretend.stub(
             status_code=200,
             json=pretend.call_recorder(lambda: {"key": "value"}),
         )
-        api_client.requests = pretend.stub(
-            delete=pretend.call_recorder(lambda *a, **kw: fake_response)
+        monkeypatch.setattr(
+            api_client,
+            "requests",
+            pretend.stub(
+                delete=pretend.call_recorder(lambda *a, **kw: fake_response)
+            ),
         )
 
         result = api_client.request_server(
@@ -85,6 +97,29 @@ class TestAPIClient:
             )
         ]
 
+    def test_request_server_with_session(self):
+        fake_response = pretend.stub(status_code=200)
+        fake_session = pretend.stub(
+            get=pretend.call_recorder(lambda *a, **kw: fake_response)
+        )
+
+        result = api_client.request_server(
+            "http://server",
+            "url",
+            api_client.Methods.GET,
+            session=fake_session,
+        )
+        assert result == fake_response
+        assert fake_session.get.calls == [
+            pretend.call(
+                "http://server/url",
+                json=None,
+                data=None,
+                headers=None,
+                timeout=300,
+            )
+        ]
+
     def test_request_server_invalid_method(self):
         with pytest.raises(ValueError) as err:
             api_client.request_server(
@@ -93,9 +128,15 @@ class TestAPIClient:
 
         assert "Internal Error. Invalid HTTP/S Method." in str(err.value)
 
-    def test_request_server_ConnectionError(self):
-        api_client.requests = pretend.stub(
-            post=pretend.raiser(api_client.ConnectionError("Failed request"))
+    def test_request_server_ConnectionError(self, monkeypatch):
+        monkeypatch.setattr(
+            api_client,
+            "requests",
+            pretend.stub(
+                post=pretend.raiser(
+                    api_client.ConnectionError("Failed request")
+                )
+            ),
         )
         with pytest.raises(api_client.click.exceptions.ClickException) as err:
             api_client.request_server(
@@ -221,21 +262,25 @@ class TestAPIClient:
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
             pretend.call(
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
             pretend.call(
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
             pretend.call(
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
         ]
 
@@ -288,16 +333,19 @@ class TestAPIClient:
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
             pretend.call(
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
             pretend.call(
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
         ]
 
@@ -335,16 +383,19 @@ class TestAPIClient:
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
             pretend.call(
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
             pretend.call(
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
         ]
 
@@ -370,6 +421,7 @@ class TestAPIClient:
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
         ]
 
@@ -394,6 +446,7 @@ class TestAPIClient:
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
         ]
 
@@ -418,6 +471,7 @@ class TestAPIClient:
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
         ]
 
@@ -457,19 +511,66 @@ class TestAPIClient:
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
             pretend.call(
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
             pretend.call(
                 "http://server",
                 "api/v1/task/?task_id=task_id",
                 api_client.Methods.GET,
+                session=ANY,
             ),
         ]
 
+    def test_task_status_polling_backoff(self, test_context, monkeypatch):
+        test_context["settings"].SERVER = "http://server"
+        fake_json = Mock()
+        fake_json.side_effect = [
+            {"data": {"state": "STARTED", "k": "v"}},
+            {"data": {"state": "RUNNING", "k": "v"}},
+            {"data": {"state": "RUNNING", "k": "v"}},
+            {"data": {"state": "RUNNING", "k": "v"}},
+            {"data": {"state": "RUNNING", "k": "v"}},
+            {"data": {"state": "RUNNING", "k": "v"}},
+            {"data": {"state": "RUNNING", "k": "v"}},
+            {
+                "data": {
+                    "state": "SUCCESS",
+                    "result": {"status": True},
+                    "k": "v",
+                }
+            },
+        ]
+        monkeypatch.setattr(
+            api_client,
+            "request_server",
+            lambda *a, **kw: pretend.stub(status_code=200, json=fake_json),
+        )
+        fake_sleep = pretend.call_recorder(lambda *a: None)
+        monkeypatch.setattr(api_client.time, "sleep", fake_sleep)
+        monkeypatch.setattr(api_client.random, "uniform", lambda *a: 0)
+
+        api_client.task_status(
+            "task_id", test_context["settings"], "Test task: "
+        )
+
+        # STARTED and the first RUNNING restart from the min delay, then the
+        # delay doubles up to the max delay.
+        assert fake_sleep.calls == [
+            pretend.call(0.25),
+            pretend.call(0.25),
+            pretend.call(0.5),
+            pretend.call(1.0),
+            pretend.call(2.0),
+            pretend.call(4.0),
+            pretend.call(5.0),
+        ]
+
     def test_publish_artifacts(self, test_context):
         test_context["settings"].SERVER = "http://server"
         api_client.request_server = pretend.call_recorder(
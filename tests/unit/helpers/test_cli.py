@@ -7,8 +7,15 @@ from typing import Iterator
 
 import pytest
 
+from repository_service_tuf.helpers import cli
 from repository_service_tuf.helpers.cli import (
+    AddPayload,
+    Artifact,
+    ArtifactInfo,
+    PayloadArtifactsHashes,
     calculate_blake2b_256,
+    calculate_blake2b_256_many,
+    calculate_length_and_blake2b_256,
     create_artifact_add_payload_from_filepath,
     create_artifact_delete_payload_from_filepath,
 )
@@ -52,6 +59,46 @@ class TestCLIHelpers:
             == blake2b_256_hash_temp_file
         )
 
+    def test_calculate_blake2b_256_chunked(self, monkeypatch, tmp_path):
+        """Test the chunked fallback used without `hashlib.file_digest`"""
+
+        monkeypatch.delattr(cli.hashlib, "file_digest", raising=False)
+        monkeypatch.setattr(cli, "HASH_CHUNK_SIZE", 4)
+        data = b"Fake data spanning several chunks"
+        test_file = tmp_path / "fake_file"
+        test_file.write_bytes(data)
+
+        assert (
+            calculate_blake2b_256(filepath=str(test_file))
+            == hashlib.blake2b(data, digest_size=32).hexdigest()
+        )
+
+    def test_calculate_blake2b_256_many(self, tmp_path) -> None:
+        """Test that hashes of several files are returned in order"""
+
+        contents = [b"first", b"second", b"third"]
+        filepaths = []
+        for i, data in enumerate(contents):
+            test_file = tmp_path / f"fake_file_{i}"
+            test_file.write_bytes(data)
+            filepaths.append(str(test_file))
+
+        assert calculate_blake2b_256_many(filepaths) == [
+            hashlib.blake2b(data, digest_size=32).hexdigest()
+            for data in contents
+        ]
+        assert calculate_blake2b_256_many([]) == []
+
+    def test_calculate_length_and_blake2b_256(
+        self, temp_file: str, blake2b_256_hash_temp_file: str
+    ) -> None:
+        """Test that the length and hash are calculated together"""
+
+        assert calculate_length_and_blake2b_256(filepath=temp_file) == (
+            os.path.getsize(temp_file),
+            blake2b_256_hash_temp_file,
+        )
+
     def test_create_artifact_add_payload_from_filepath(
         self, temp_file: str, blake2b_256_hash_temp_file: str
     ) -> None:
@@ -72,7 +119,7 @@ class TestCLIHelpers:
                         },
                         "custom": None,
                     },
-                    "path": f"{path}{temp_file.split('/')[-1]}",
+                    "path": f"{path}{os.path.basename(temp_file)}",
                 }
             ],
             "add_task_id_to_custom": False,
@@ -99,7 +146,7 @@ class TestCLIHelpers:
         path = "/fake/path/"
 
         expected_artifact_payload = {
-            "artifacts": [f"{path}{temp_file.split('/')[-1]}"]
+            "artifacts": [f"{path}{os.path.basename(temp_file)}"]
         }
 
         result = create_artifact_delete_payload_from_filepath(
@@ -120,7 +167,7 @@ class TestCLIHelpers:
         path = None
 
         expected_artifact_payload = {
-            "artifacts": [f"{temp_file.split('/')[-1]}"]
+            "artifacts": [f"{os.path.basename(temp_file)}"]
         }
 
         result = create_artifact_delete_payload_from_filepath(
@@ -128,3 +175,38 @@ class TestCLIHelpers:
             path=path,
         )
         assert result == expected_artifact_payload
+
+    def test_add_payload_to_dict(self) -> None:
+        """Test that `AddPayload.to_dict` serializes nested artifacts"""
+
+        payload = AddPayload(
+            artifacts=[
+                Artifact(
+                    info=ArtifactInfo(
+                        length=9,
+                        hashes={PayloadArtifactsHashes.blake2b_256: "abc"},
+                        custom={"key": "value"},
+                    ),
+                    path="file.tar.gz",
+                )
+            ],
+            add_task_id_to_custom=True,
+        )
+
+        result = payload.to_dict()
+        assert result == {
+            "artifacts": [
+                {
+                    "info": {
+                        "length": 9,
+                        "hashes": {"blake2b-256": "abc"},
+                        "custom": {"key": "value"},
+                    },
+                    "path": "file.tar.gz",
+                }
+            ],
+            "add_task_id_to_custom": True,
+            "publish_artifacts": True,
+        }
+        hash_key = next(iter(result["artifacts"][0]["info"]["hashes"]))
+        assert type(hash_key) is str
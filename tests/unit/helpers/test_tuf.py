@@ -37,6 +37,19 @@ class TestRSTUFKey:
         assert key != ""
 
 
+class TestBootstrapSetup:
+    def test_to_dict(self, test_setup):
+        assert test_setup.to_dict() == {
+            "roles": {
+                "root": {"expiration": 365},
+                "targets": {"expiration": 365},
+                "snapshot": {"expiration": 1},
+                "timestamp": {"expiration": 1},
+                "bins": {"expiration": 1, "number_of_delegated_bins": 256},
+            }
+        }
+
+
 class TestTUFHelperFunctions:
     def test__conform_rsa_in_aws_format(self):
         pub_key = "MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEArrJWZ7ieuDiQTlKVcCNx1/pT+8jN1BOMM2xM511Hp1TBi09pSgqsw9pS/o8oV24Q2Q9ebjbKIwqjhTZYLnKOUk4pKMgL56MvqXJLTUvR+9IC1vPuEURUGBjZqew7A11BbdII3BJVVH/F9rKvgiDLZ9WzM5rZGzQi4L52u4Gb3uSLF0QEXBx7i58DF7zs34GpZqgseKN0Q6kb8Vp4VcoDWeW+OCbWNIJd0Bas7ojUi9IosUlJJNE5f2UxqDCNwtf6PiEcYfulU3zIpO3rAuVJ/iKzBMQ61FtsaUd3M4kjsozoAEK3WSqW+RtuYVj5Rr0HYUFB2QXOsDVzIdZ7GLicXQIDAQAB"  # noqa
@@ -50,6 +63,8 @@ class TestTUFHelperFunctions:
         assert result == pub_key
 
     def test_load_key(self, monkeypatch):
+        monkeypatch.setattr(tuf.os.path, "isfile", lambda a: True)
+        monkeypatch.setattr(tuf.os.path, "getsize", lambda a: 1)
         monkeypatch.setattr(
             tuf,
             "import_privatekey_from_file",
@@ -65,6 +80,8 @@ class TestTUFHelperFunctions:
         ]
 
     def test_load_key_CryptoError(self, monkeypatch):
+        monkeypatch.setattr(tuf.os.path, "isfile", lambda a: True)
+        monkeypatch.setattr(tuf.os.path, "getsize", lambda a: 1)
         monkeypatch.setattr(
             tuf,
             "import_privatekey_from_file",
@@ -84,6 +101,8 @@ class TestTUFHelperFunctions:
         )
 
     def test_load_key_OSError(self, monkeypatch):
+        monkeypatch.setattr(tuf.os.path, "isfile", lambda a: True)
+        monkeypatch.setattr(tuf.os.path, "getsize", lambda a: 1)
         monkeypatch.setattr(
             tuf,
             "import_privatekey_from_file",
@@ -96,22 +115,42 @@ class TestTUFHelperFunctions:
             {}, None, error=":cross_mark: [red]Failed[/]: permission denied"
         )
 
+    def test_load_key_file_not_found(self, tmp_path):
+        result = load_key(
+            str(tmp_path / "missing"), KeyType.KEY_TYPE_ED25519.value, "", ""
+        )
+        assert result == RSTUFKey(
+            {}, None, error=":cross_mark: [red]Failed[/]: File not found."
+        )
+
+    def test_load_key_empty_file(self, tmp_path):
+        key_path = tmp_path / "empty"
+        key_path.touch()
+        result = load_key(
+            str(key_path), KeyType.KEY_TYPE_ED25519.value, "", ""
+        )
+        assert result == RSTUFKey(
+            {}, None, error=":cross_mark: [red]Failed[/]: Empty key file."
+        )
+
     def test_load_payload(self, monkeypatch):
-        fake_data = [
-            pretend.stub(read=pretend.call_recorder(lambda: b"{'k': 'v'}"))
-        ]
+        fake_data = pretend.stub(
+            read=pretend.call_recorder(lambda: b'{"k": "v"}')
+        )
         fake_file_obj = pretend.stub(
             __enter__=pretend.call_recorder(lambda: fake_data),
             __exit__=pretend.call_recorder(lambda *a: None),
             close=pretend.call_recorder(lambda: None),
-            read=pretend.call_recorder(lambda: fake_data),
         )
-        monkeypatch.setitem(tuf.__builtins__, "open", lambda *a: fake_file_obj)
-        tuf.json.load = pretend.call_recorder(lambda *a: {"k": "v"})
+        fake_open = pretend.call_recorder(lambda *a, **kw: fake_file_obj)
+        monkeypatch.setitem(tuf.__builtins__, "open", fake_open)
 
         result = tuf.load_payload("new_file")
         assert result == {"k": "v"}
-        assert tuf.json.load.calls == [pretend.call(fake_data)]
+        assert fake_data.read.calls == [pretend.call()]
+        assert fake_open.calls == [
+            pretend.call("new_file", "rb", buffering=tuf.PAYLOAD_BUFFER_SIZE)
+        ]
 
     def test_load_payload_OSError(self, monkeypatch):
         monkeypatch.setitem(
@@ -135,18 +174,24 @@ class TestTUFHelperFunctions:
             close=pretend.call_recorder(lambda: None),
             write=pretend.call_recorder(lambda: fake_data),
         )
-        fake_open = pretend.call_recorder(lambda *a: fake_file_obj)
+        fake_open = pretend.call_recorder(lambda *a, **kw: fake_file_obj)
         monkeypatch.setitem(tuf.__builtins__, "open", fake_open)
         monkeypatch.setattr(
             tuf.json,
-            "dumps",
-            pretend.call_recorder(lambda *a, **kw: "{'k': 'v'}"),
+            "dump",
+            pretend.call_recorder(lambda *a, **kw: None),
         )
 
         result = tuf.save_payload("new_file", {"k": "v"})
         assert result is None
-        assert tuf.json.dumps.calls == [pretend.call({"k": "v"}, indent=2)]
-        assert fake_open.calls == [pretend.call("new_file.json", "w")]
+        assert tuf.json.dump.calls == [
+            pretend.call({"k": "v"}, fake_data, indent=2)
+        ]
+        assert fake_open.calls == [
+            pretend.call(
+                "new_file.json", "w", buffering=tuf.PAYLOAD_BUFFER_SIZE
+            )
+        ]
 
     def test_save_payload_file_with_json_suffix(self, monkeypatch):
         fake_data = pretend.stub(
@@ -158,18 +203,24 @@ class TestTUFHelperFunctions:
             close=pretend.call_recorder(lambda: None),
             write=pretend.call_recorder(lambda: fake_data),
         )
-        fake_open = pretend.call_recorder(lambda *a: fake_file_obj)
+        fake_open = pretend.call_recorder(lambda *a, **kw: fake_file_obj)
         monkeypatch.setitem(tuf.__builtins__, "open", fake_open)
         monkeypatch.setattr(
             tuf.json,
-            "dumps",
-            pretend.call_recorder(lambda *a, **kw: "{'k': 'v'}"),
+            "dump",
+            pretend.call_recorder(lambda *a, **kw: None),
         )
 
         result = tuf.save_payload("new_file.json", {"k": "v"})
         assert result is None
-        assert tuf.json.dumps.calls == [pretend.call({"k": "v"}, indent=2)]
-        assert fake_open.calls == [pretend.call("new_file.json", "w")]
+        assert tuf.json.dump.calls == [
+            pretend.call({"k": "v"}, fake_data, indent=2)
+        ]
+        assert fake_open.calls == [
+            pretend.call(
+                "new_file.json", "w", buffering=tuf.PAYLOAD_BUFFER_SIZE
+            )
+        ]
 
     def test_save_payload_OSError(self, monkeypatch):
         monkeypatch.setitem(